@@ -1,4 +1,12 @@
 from dataclasses import dataclass
+from functools import cached_property
+
+from PySide6.QtGui import QColor
+
+
+def _qcolor(field: str) -> cached_property:
+    """Expose the hex string stored in `field` as a QColor parsed on first use."""
+    return cached_property(lambda self: QColor(getattr(self, field)))
 
 
 @dataclass
@@ -28,4 +36,28 @@ class DarkTheme:
     COLOR_ERROR: str = "#f85149"        # A clear red for errors and alerts
     COLOR_INFO: str = "#58a6ff"         # A calm blue for informational messages
 
+    # QColor counterparts for paint code; the COLOR_* hex strings stay the
+    # source of truth and are what stylesheets interpolate.
+    primary = _qcolor("COLOR_PRIMARY")
+    secondary = _qcolor("COLOR_SECONDARY")
+    background = _qcolor("COLOR_BACKGROUND")
+    surface = _qcolor("COLOR_SURFACE")
+    background_alt = _qcolor("COLOR_BACKGROUND_ALT")
+    surface_light = _qcolor("COLOR_SURFACE_LIGHT")
+    background_deep = _qcolor("COLOR_BACKGROUND_DEEP")
+    text_primary = _qcolor("COLOR_TEXT_PRIMARY")
+    text_secondary = _qcolor("COLOR_TEXT_SECONDARY")
+    border = _qcolor("COLOR_BORDER")
+    success = _qcolor("COLOR_SUCCESS")
+    warning = _qcolor("COLOR_WARNING")
+    error = _qcolor("COLOR_ERROR")
+    info = _qcolor("COLOR_INFO")
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name.startswith("COLOR_"):
+            # The theme can be edited in place: drop the QColor parsed from
+            # the old value (COLOR_FOO_BAR -> foo_bar) so it is rebuilt on use.
+            self.__dict__.pop(name[6:].lower(), None)
+
 color_theme = DarkTheme()
\ No newline at end of file
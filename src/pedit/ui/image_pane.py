@@ -1,15 +1,125 @@
+from dataclasses import astuple
+from functools import lru_cache
 
-from PySide6.QtCore import Qt, QRect, QSize, Signal, QSignalBlocker  
+from PySide6.QtCore import Qt, QEvent, QRect, QSize, QTimer, Signal
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QSizePolicy, QTabWidget, QTabBar, QInputDialog, QPushButton, QToolButton,
-    QDialog, QLineEdit, QLabel, QScrollArea, QFrame
+    QWidget, QVBoxLayout, QHBoxLayout,
+    QSizePolicy, QTabWidget, QTabBar, QDialog
 )
-# Remove this line; use Signal from PySide6.QtCore instead.
 
 from pedit.core.theme import color_theme
 
 
+@lru_cache(maxsize=8)
+def _rendered_image_pane_qss(background_alt, border) -> str:
+    """Format the pane stylesheet; memoized on the colour values it uses."""
+    return (
+        f"background-color: {background_alt};"
+        "color:black;"
+        f"border-right: 1px solid {border};"
+    )
+
+
+def _image_pane_qss(theme) -> str:
+    return _rendered_image_pane_qss(theme.COLOR_BACKGROUND_ALT, theme.COLOR_BORDER)
+
+
+@lru_cache(maxsize=8)
+def _rendered_dialog_qss(
+    text_primary, surface, surface_light, border, background, background_alt, primary
+) -> str:
+    """Format the dialog stylesheet; memoized on the colour values it uses."""
+    return f"""
+    QLabel{{ 
+        color: {text_primary}; 
+        background: transparent;
+        border: none;
+    }}
+    QDialog#NewCanvasDialog {{
+        background: {surface};
+        color: {text_primary};
+        border: 1px solid {border};
+    }}
+    QLabel#DialogTitle {{
+        color: {text_primary};
+    }}
+    QLineEdit {{
+        background: {background};
+        border: 1px solid {border};
+        padding: 4px 6px;
+        border-radius: 4px;
+        color: {text_primary};
+    }}
+    QLineEdit:focus {{
+        border: 1px solid {primary};
+    }}
+    QPushButton {{
+        background: {surface_light};
+        border: 1px solid {border};
+        padding: 6px 14px;
+        border-radius: 5px;
+        color: {text_primary};
+    }}
+    QPushButton:hover {{ background: {background_alt}; }}
+    QPushButton:pressed {{ background: {background}; }}
+"""
+
+
+def _dialog_qss(theme) -> str:
+    return _rendered_dialog_qss(
+        theme.COLOR_TEXT_PRIMARY,
+        theme.COLOR_SURFACE,
+        theme.COLOR_SURFACE_LIGHT,
+        theme.COLOR_BORDER,
+        theme.COLOR_BACKGROUND,
+        theme.COLOR_BACKGROUND_ALT,
+        theme.COLOR_PRIMARY,
+    )
+
+
+_TAB_STYLESHEET_TEMPLATE = """
+        QTabWidget::pane {{ border: 0; }}
+        QTabBar::tab {{
+            background: {surface};
+            color: {text_secondary};
+            padding: 5px 18px;           /* room for close button */
+            border: 1px solid {border};
+            border-bottom: 2px solid {background_deep};
+            border-top-left-radius: 6px;
+            border-top-right-radius: 6px;
+            margin-right: 2px;
+            font-size: 12px;
+            min-width: 88px;             /* keep close button usable when crowded */
+        }}
+        QTabBar::tab:selected {{
+            background: {surface_light};
+            color: {text_primary};
+            border-bottom: 2px solid {primary};
+        }}
+        QTabBar::tab:!selected:hover {{ background: {surface_light}; }}
+        """
+
+
+@lru_cache(maxsize=8)
+def _rendered_tab_stylesheet(surface, text_secondary, border, background_deep,
+                             surface_light, text_primary, primary) -> str:
+    """Format the tab stylesheet; memoized on the colour values it uses."""
+    return _TAB_STYLESHEET_TEMPLATE.format(
+        surface=surface, text_secondary=text_secondary, border=border,
+        background_deep=background_deep, surface_light=surface_light,
+        text_primary=text_primary, primary=primary,
+    )
+
+
+def _tab_widget_qss(theme) -> str:
+    return _rendered_tab_stylesheet(
+        theme.COLOR_SURFACE, theme.COLOR_TEXT_SECONDARY, theme.COLOR_BORDER,
+        theme.COLOR_BACKGROUND_DEEP, theme.COLOR_SURFACE_LIGHT,
+        theme.COLOR_TEXT_PRIMARY, theme.COLOR_PRIMARY,
+    )
+
+
 class ImageCanvas(QWidget):
     """A drawable canvas that maintains a target aspect ratio.
 
@@ -25,17 +135,38 @@ class ImageCanvas(QWidget):
         (16, 9),    # Widescreen landscape
         (9, 16),    # Portrait
     ]
+    # Preset -> position in DEFAULT_ASPECTS; custom ratios are simply absent
+    _DEFAULT_ASPECT_INDEX = {ratio: i for i, ratio in enumerate(DEFAULT_ASPECTS)}
+
+    # Transparency checkerboard shown under translucent backgrounds
+    _CHECKER_CELL = 8  # logical px per square
+    _CHECKER_LIGHT = QColor("#ffffff")
+    _CHECKER_DARK = QColor("#cccccc")
 
     def __init__(self, aspect_ratio=(1, 1), background="#ffffff", parent=None):
         super().__init__(parent)
         self._aspect = aspect_ratio
+        self._aspect_idx = self._DEFAULT_ASPECT_INDEX.get(tuple(aspect_ratio))
         self._bg = background
+        # Paint caches: the canvas rect is only recomputed when its key (the
+        # available rect and the aspect) changes; Qt brush/pen objects are
+        # built up front.
+        self._cached_rect = None
+        self._cached_key = None
+        self._cached_size_hint = None
+        self._bg_brush = QBrush(QColor(background))
+        self._bg_tile = None  # checkerboard + background, built on first use
+        self._bg_tile_dpr = None
+        # Whole canvas (fill + border) pre-rendered at its current size
+        self._canvas_pix = None
+        self._canvas_pix_key = None
+        self._rebuildPaintCaches(color_theme)
         # Allow the widget to expand; we'll center the internal canvas area.
-        sp = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        sp.setHeightForWidth(True)  # Tell layout system we keep ratio
-        self.setSizePolicy(sp)
-        # Enable stylesheet / custom painting background separation
-        self.setAttribute(Qt.WA_StyledBackground, True)
+        # No height-for-width: the aspect is kept by _compute_canvas_rect at
+        # paint time, so the layout doesn't need extra solver passes per resize.
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # No WA_StyledBackground: the canvas has no stylesheet of its own, so
+        # Qt would only paint pixels that paintEvent or the parent cover anyway.
         self.setMinimumSize(50, 50)
 
     # ---------------- Aspect Ratio API -----------------
@@ -43,144 +174,374 @@ class ImageCanvas(QWidget):
         return self._aspect
 
     def setAspectRatio(self, w: int, h: int):
-        if w <= 0 or h <= 0:
+        if w <= 0 or h <= 0 or (w, h) == self._aspect:
             return
         self._aspect = (w, h)
-        self.updateGeometry()  # trigger relayout for new ratio
-        self.update()
+        self._aspect_idx = self._DEFAULT_ASPECT_INDEX.get(self._aspect)
+        self._aspectChanged()
 
     def cycleAspectRatio(self):
         """Cycle through predefined aspect ratios."""
-        try:
-            idx = self.DEFAULT_ASPECTS.index(self._aspect)
-            self._aspect = self.DEFAULT_ASPECTS[(idx + 1) % len(self.DEFAULT_ASPECTS)]
-        except ValueError:
-            self._aspect = self.DEFAULT_ASPECTS[0]
+        if self._aspect_idx is None:
+            idx = 0  # custom ratio: restart from the first preset
+        else:
+            idx = (self._aspect_idx + 1) % len(self.DEFAULT_ASPECTS)
+        new_aspect = self.DEFAULT_ASPECTS[idx]
+        self._aspect_idx = idx
+        if new_aspect == self._aspect:
+            return
+        self._aspect = new_aspect
+        self._aspectChanged()
+
+    def _aspectChanged(self):
+        """Single invalidation path for a real aspect change."""
+        self._cached_size_hint = None
+        self.updateGeometry()  # sizeHint follows the ratio; trigger relayout
+        # updateGeometry() alone won't repaint when the layout keeps our
+        # geometry (e.g. inside the tab stack), so schedule exactly one paint.
+        self.update()
+
+    # ---------------- Background API -----------------
+    def background(self):
+        return self._bg
+
+    def setBackground(self, color):
+        if color == self._bg:
+            return
+        self._bg = color
+        self._bg_brush = QBrush(QColor(color))
+        self._bg_tile = None
+        self._canvas_pix_key = None
+        self.update()
+
+    def _backgroundTile(self):
+        """Return the pre-baked tile for a translucent background.
+
+        The tile (a 2x2 checkerboard with the background composited on top)
+        is rendered once and rebuilt only when the background or the
+        device pixel ratio changes; painting then just blits it.
+        """
+        dpr = self.devicePixelRatioF()
+        if self._bg_tile is None or dpr != self._bg_tile_dpr:
+            cell = self._CHECKER_CELL
+            side = 2 * cell
+            tile = QPixmap(round(side * dpr), round(side * dpr))
+            tile.setDevicePixelRatio(dpr)
+            tile.fill(self._CHECKER_LIGHT)
+            p = QPainter(tile)
+            p.fillRect(0, 0, cell, cell, self._CHECKER_DARK)
+            p.fillRect(cell, cell, cell, cell, self._CHECKER_DARK)
+            p.fillRect(0, 0, side, side, self._bg_brush)
+            p.end()
+            self._bg_tile = tile
+            self._bg_tile_dpr = dpr
+        return self._bg_tile
+
+    # ---------------- Theming -----------------
+    def _rebuildPaintCaches(self, theme):
+        """Snapshot the theme colours paintEvent needs into prebuilt Qt objects.
+
+        Connected to ImagePane.themeChanged so steady-state painting never
+        reads the theme itself.
+        """
+        self._border_color = theme.border
+        self._border_pen = QPen(self._border_color)
+        # Width 0 cosmetic pen: always one device pixel, no transform widening
+        self._border_pen.setCosmetic(True)
+        self._border_pen.setWidth(0)
+        self._canvas_pix_key = None
         self.update()
 
     # ---------------- Geometry Helpers -----------------
     def _compute_canvas_rect(self):
+        """Return the centered canvas rect, cached until geometry or aspect change."""
         avail = self.contentsRect()
+        key = (avail, self._aspect)
+        if key != self._cached_key:
+            self._cached_rect = self._fit_canvas_rect(avail)
+            self._cached_key = key
+        return self._cached_rect
+
+    def _fit_canvas_rect(self, avail):
         aw, ah = avail.width(), avail.height()
         rw, rh = self._aspect
         if rw == 0 or rh == 0 or aw <= 0 or ah <= 0:
             return avail
-        scale = min(aw / rw, ah / rh)
-        cw = int(rw * scale)
-        ch = int(rh * scale)
+        # Aspect-fit with integer cross-multiplication: no float division
+        # and no temporary QSize per resize.
+        if aw * rh <= ah * rw:
+            cw, ch = aw, (aw * rh) // rw
+        else:
+            cw, ch = (ah * rw) // rh, ah
         x = avail.x() + (aw - cw) // 2
         y = avail.y() + (ah - ch) // 2
         return QRect(x, y, cw, ch)
 
     def paintEvent(self, event):  # noqa: D401
-        from PySide6.QtGui import QPainter, QColor, QPen
+        canvas_rect = self._compute_canvas_rect()
+        # Nothing to do for a zero-area canvas (construction, collapsed tab
+        # page) or when the damaged region doesn't touch the canvas.
+        if canvas_rect.isEmpty() or not event.region().intersects(canvas_rect):
+            return
+        # Only touch the damaged part of the widget Qt asked us to repaint
+        exposed = event.rect()
+
         painter = QPainter(self)
-        try:
-            # Fill background (pane behind canvas) with transparent or theme color
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
-
-            canvas_rect = self._compute_canvas_rect()
-            painter.fillRect(canvas_rect, QColor(self._bg))
-            pen = QPen(QColor(color_theme.COLOR_BORDER))
-            pen.setWidth(1)
-            painter.setPen(pen)
-            painter.drawRect(canvas_rect.adjusted(0, 0, -1, -1))
-        finally:
-            painter.end()
+        # Everything drawn here is pixel-aligned; keep the rasterizer on
+        # plain span fills instead of coverage computation.
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        # Everything drawn is opaque (solid brush, pre-composited tile,
+        # theme border), so skip per-pixel alpha blending entirely.
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.setClipRect(exposed)
+        # The pane behind the canvas is left to the parent's background;
+        # a zero-alpha fill there would walk every pixel for no effect.
+        painter.drawPixmap(canvas_rect.topLeft(), self._canvasPixmap(canvas_rect.size()))
+        painter.end()
+
+    def _canvasPixmap(self, size: QSize):
+        """Return the canvas (background + border) pre-rendered at `size`.
+
+        Rendered once per (size, device pixel ratio) and whenever the
+        background or border pen changes; other repaints are a single blit.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (size, dpr)
+        if key != self._canvas_pix_key:
+            pix = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+            pix.setDevicePixelRatio(dpr)
+            rect = QRect(0, 0, size.width(), size.height())
+            opaque = self._bg_brush.color().alpha() == 255
+            # Initialise every device pixel: it is blitted with Source
+            # composition, and at DPR > 1 the one-pixel border stroke leaves
+            # the last device row/column untouched.
+            pix.fill(self._bg_brush.color() if opaque else Qt.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.Antialiasing, False)
+            p.setCompositionMode(QPainter.CompositionMode_Source)
+            if not opaque:
+                p.drawTiledPixmap(rect, self._backgroundTile())
+            p.setPen(self._border_pen)
+            p.drawRect(rect.adjusted(0, 0, -1, -1))
+            p.end()
+            self._canvas_pix = pix
+            self._canvas_pix_key = key
+        return self._canvas_pix
 
     # Optionally provide a size hint (scaled baseline)
     def sizeHint(self):
-        rw, rh = self._aspect
-        base_w = 480  # desired nominal width
-        # compute height from aspect
-        return QSize(base_w, int(base_w * rh / rw))
+        # Layouts query this repeatedly; it only changes with the aspect.
+        if self._cached_size_hint is None:
+            rw, rh = self._aspect
+            base_w = 480  # desired nominal width
+            # compute height from aspect
+            self._cached_size_hint = QSize(base_w, (base_w * rh) // rw)
+        return self._cached_size_hint
 
     def minimumSizeHint(self):
         return QSize(50, 50)
 
-    # ---- Height-for-width support so layout preserves aspect automatically ----
-    def hasHeightForWidth(self):
-        return True
-
-    def heightForWidth(self, w: int):
-        rw, rh = self._aspect
-        if rw == 0:
-            return w
-        return int(w * rh / rw)
 
-    # Optional: ensure we never overflow vertically by capping width if needed
-    def resizeEvent(self, event):
-        # If the computed height would exceed available (due to outer constraints), we just repaint;
-        # layout will already have picked a size that fits, thanks to heightForWidth.
-        super().resizeEvent(event)
+class _AspectGrid(QWidget):
+    """Grid of clickable aspect-ratio preview cards painted by one widget."""
+    ratioSelected = Signal(tuple)  # emits the chosen (w, h) ratio
+    # Theme colour values -> prebuilt colours/pens/brushes shared by every
+    # grid. Keyed by value, not id(): a theme edited in place or a new theme
+    # reusing a collected object's id must not get a stale palette.
+    _palette_cache: dict[tuple, dict] = {}
 
+    COLUMNS = 4
+    SPACING = 10
+    MARGIN = 4
+    CARD_MIN_W = 88
+    CARD_MAX_W = 110
+    CARD_MIN_H = 74
 
-class _AspectPreview(QFrame):
-    """Clickable preview card representing an aspect ratio visually."""
-    clicked = Signal(object)  # emits self when selected
-    def __init__(self, ratio: tuple[int, int], theme, parent=None):
+    def __init__(self, aspects, theme, parent=None):
         super().__init__(parent)
-        self.ratio = ratio
+        self._aspects = list(aspects)
         self.theme = theme
+        self._pal = self._palette(theme)
+        # Theme part of the QPixmapCache keys, by value for the same reason
+        self._theme_tag = ",".join(astuple(theme))
+        self._selected = -1
+        self._hover = -1
+        # Card rects for the last laid-out size
+        self._rects: list[QRect] = []
+        self._rects_size = QSize()
         self.setCursor(Qt.PointingHandCursor)
-        self.setMinimumSize(88, 74)
-        self.setMaximumWidth(110)
-        # Remove any native frame painting to avoid stray border lines
-        self.setFrameShape(QFrame.NoFrame)
-        self.setFrameShadow(QFrame.Plain)
-        self._selected = False
-        self._hover = False
-        self.setStyleSheet("")  # we'll paint manually
-        self.setAttribute(Qt.WA_Hover, True)
-
-    def setSelected(self, sel: bool):
-        if self._selected != sel:
-            self._selected = sel
-            self.update()
-
-    def isSelected(self):
-        return self._selected
+        self.setMouseTracking(True)
+        # Fill the scroll viewport, like the grid layout of card widgets did
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    @classmethod
+    def _palette(cls, theme) -> dict:
+        """Return the paint objects for `theme`, built once per theme."""
+        key = astuple(theme)
+        pal = cls._palette_cache.get(key)
+        if pal is None:
+            hover_bg = QColor(theme.COLOR_SURFACE_LIGHT)
+            hover_bg.setAlpha(120)
+            border_sel = QPen(QColor(theme.COLOR_PRIMARY))
+            border_sel.setWidth(2)
+            inner_pen_sel = QPen(QColor(theme.COLOR_PRIMARY))
+            inner_pen_sel.setWidth(1)
+            inner_pen_unsel = QPen(QColor(theme.COLOR_TEXT_SECONDARY))
+            inner_pen_unsel.setWidth(1)
+            pal = cls._palette_cache[key] = {
+                "bg_sel": QColor(theme.COLOR_SURFACE_LIGHT),
+                "bg_hover": hover_bg,
+                "border_sel": border_sel,
+                "inner_pen_sel": inner_pen_sel,
+                "inner_pen_unsel": inner_pen_unsel,
+                "label_pen_sel": QPen(QColor(theme.COLOR_TEXT_PRIMARY)),
+                "label_pen_unsel": QPen(QColor(theme.COLOR_TEXT_SECONDARY)),
+                "inner_brush": QBrush(QColor(theme.COLOR_BACKGROUND)),
+            }
+        return pal
+
+    # ---------------- Selection -----------------
+    def selectedRatio(self) -> tuple[int, int] | None:
+        if self._selected == -1:
+            return None
+        return self._aspects[self._selected]
+
+    def setSelectedRatio(self, ratio: tuple[int, int]):
+        try:
+            idx = self._aspects.index(tuple(ratio))
+        except ValueError:
+            idx = -1
+        self._setSelected(idx)
+
+    def _setSelected(self, idx: int):
+        if idx != self._selected:
+            self._updateCards(self._selected, idx)
+            self._selected = idx
+
+    def _setHover(self, idx: int):
+        if idx != self._hover:
+            self._updateCards(self._hover, idx)
+            self._hover = idx
+
+    def _updateCards(self, *indices: int):
+        """Schedule a repaint of just the given cards (-1 is ignored)."""
+        rects = self._cardRects()
+        for i in indices:
+            if i != -1:
+                self.update(rects[i])
+
+    # ---------------- Layout -----------------
+    def _rows(self) -> int:
+        return -(-len(self._aspects) // self.COLUMNS)
+
+    def _cardRects(self) -> list[QRect]:
+        """Card rects for the current size, recomputed only when it changes.
+
+        Mirrors the QGridLayout the cards used to live in: the width and height
+        are shared evenly across the cells, each card is as wide as its cell
+        within 88-110px (centred in it) and stretches to the cell height
+        (at least 74px).
+        """
+        size = self.size()
+        if size != self._rects_size:
+            cols, sp, m = self.COLUMNS, self.SPACING, self.MARGIN
+            rows = self._rows()
+            cell_w = (size.width() - 2 * m - (cols - 1) * sp) // cols
+            cell_h = (size.height() - 2 * m - max(rows - 1, 0) * sp) // max(rows, 1)
+            card_w = max(self.CARD_MIN_W, min(self.CARD_MAX_W, cell_w))
+            card_h = max(self.CARD_MIN_H, cell_h)
+            cell_w = max(cell_w, card_w)
+            inset = (cell_w - card_w) // 2
+            self._rects = [
+                QRect(m + (i % cols) * (cell_w + sp) + inset,
+                      m + (i // cols) * (card_h + sp),
+                      card_w, card_h)
+                for i in range(len(self._aspects))
+            ]
+            self._rects_size = size
+        return self._rects
+
+    def _cardAt(self, pos) -> int:
+        for i, r in enumerate(self._cardRects()):
+            if r.contains(pos):
+                return i
+        return -1
+
+    def sizeHint(self):
+        cols, sp, m = self.COLUMNS, self.SPACING, self.MARGIN
+        rows = self._rows()
+        return QSize(2 * m + cols * self.CARD_MAX_W + (cols - 1) * sp,
+                     2 * m + rows * self.CARD_MIN_H + max(rows - 1, 0) * sp)
+
+    def minimumSizeHint(self):
+        cols, sp, m = self.COLUMNS, self.SPACING, self.MARGIN
+        return QSize(2 * m + cols * self.CARD_MIN_W + (cols - 1) * sp,
+                     self.sizeHint().height())
 
+    # ---------------- Events -----------------
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            # Emit a signal instead of assuming parent has a method
-            self.clicked.emit(self)
-            return
+            idx = self._cardAt(event.position().toPoint())
+            if idx != -1:
+                self._setSelected(idx)
+                self.ratioSelected.emit(self._aspects[idx])
+                return
         super().mousePressEvent(event)
 
-    def enterEvent(self, event):
-        self._hover = True
-        self.update()
-        super().enterEvent(event)
+    def mouseMoveEvent(self, event):
+        # Mouse tracking instead of WA_Hover: only entering or leaving a card
+        # repaints, and then only the two cards involved.
+        self._setHover(self._cardAt(event.position().toPoint()))
+        super().mouseMoveEvent(event)
 
     def leaveEvent(self, event):
-        self._hover = False
-        self.update()
+        self._setHover(-1)
         super().leaveEvent(event)
 
-    def paintEvent(self, event):  # draws card + inner rectangle representing ratio
-        from PySide6.QtGui import QPainter, QColor, QPen, QBrush
+    def paintEvent(self, event):  # blits every card that intersects the dirty region
         painter = QPainter(self)
-        r = self.rect().adjusted(4, 4, -4, -4)
+        # The region, not its bounding rect: a hover move dirties two cards
+        region = event.region()
+        for i, card in enumerate(self._cardRects()):
+            if not region.intersects(card):
+                continue
+            pm = self._cardPixmap(self._aspects[i], card.size(),
+                                  i == self._selected, i == self._hover)
+            painter.drawPixmap(card.topLeft(), pm)
+        painter.end()
+
+    def _cardPixmap(self, ratio, size: QSize, selected: bool, hover: bool) -> QPixmap:
+        """Rendered card for this state, shared through QPixmapCache."""
+        dpr = self.devicePixelRatioF()
+        key = (f"apcard:{ratio[0]}x{ratio[1]}:{int(selected)}{int(hover)}:"
+               f"{size.width()}x{size.height()}@{dpr}:{self._theme_tag}")
+        pm = QPixmap()
+        if not QPixmapCache.find(key, pm):
+            pm = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            painter = QPainter(pm)
+            rect = QRect(0, 0, size.width(), size.height())
+            self._paintCard(painter, rect.adjusted(4, 4, -4, -4), ratio,
+                            selected, hover, self._pal)
+            painter.end()
+            QPixmapCache.insert(key, pm)
+        return pm
+
+    @staticmethod
+    def _paintCard(painter, r: QRect, ratio, selected: bool, hover: bool, pal: dict):
         # Background strategy: transparent when idle (no perceived border lines),
         # subtle tint on hover, solid surface light with outline when selected.
-        if self._selected:
-            bg = QColor(self.theme.COLOR_SURFACE_LIGHT)
-            painter.fillRect(r, bg)
-            pen = QPen(QColor(self.theme.COLOR_PRIMARY))
-            pen.setWidth(2)
-            painter.setPen(pen)
+        if selected:
+            painter.fillRect(r, pal["bg_sel"])
+            painter.setPen(pal["border_sel"])
+            painter.setBrush(Qt.NoBrush)
             painter.drawRoundedRect(r, 6, 6)
-        else:
-            if self._hover:
-                hov = QColor(self.theme.COLOR_SURFACE_LIGHT)
-                hov.setAlpha(120)
-                painter.fillRect(r, hov)
-            # no outer border when not selected
-            painter.setPen(Qt.NoPen)
+        elif hover:
+            painter.fillRect(r, pal["bg_hover"])
 
         # Compute inner preview area based on aspect
-        aw, ah = self.ratio
+        aw, ah = ratio
         if aw <= 0 or ah <= 0:
             return
         avail_w = r.width() - 14
@@ -190,23 +551,21 @@ class _AspectPreview(QFrame):
         ph = int(ah * scale)
         px = r.x() + (r.width() - pw)//2
         py = r.y() + 10 + (avail_h - ph)//2
-        inner_rect = QRect(px, py, pw, ph)
-        painter.setBrush(QBrush(QColor(self.theme.COLOR_BACKGROUND)))
-        pen2 = QPen(QColor(self.theme.COLOR_PRIMARY if self._selected else self.theme.COLOR_TEXT_SECONDARY))
-        pen2.setWidth(1)
-        painter.setPen(pen2)
-        painter.drawRect(inner_rect)
+        painter.setBrush(pal["inner_brush"])
+        painter.setPen(pal["inner_pen_sel"] if selected else pal["inner_pen_unsel"])
+        painter.drawRect(QRect(px, py, pw, ph))
 
         # Label below preview
-        painter.setPen(QColor(self.theme.COLOR_TEXT_PRIMARY if self._selected else self.theme.COLOR_TEXT_SECONDARY))
-        label = f"{aw}:{ah}"
-        painter.drawText(r.adjusted(0, ph + 12, 0, 0), Qt.AlignHCenter | Qt.AlignTop, label)
-        painter.end()
+        painter.setPen(pal["label_pen_sel"] if selected else pal["label_pen_unsel"])
+        painter.drawText(r.adjusted(0, ph + 12, 0, 0), Qt.AlignHCenter | Qt.AlignTop, f"{aw}:{ah}")
 
 
 class NewCanvasDialog(QDialog):
     """Custom styled dialog with visual aspect ratio templates."""
     def __init__(self, parent=None, default_name: str = "Untitled", aspects=None):
+        # Dialog-only widgets; the dialog opens on demand, so skip them at import
+        from PySide6.QtWidgets import QFrame, QLabel, QLineEdit, QPushButton, QScrollArea
+
         super().__init__(parent)
         self.setWindowTitle("Create New Canvas")
         self.setModal(True)
@@ -245,22 +604,10 @@ class NewCanvasDialog(QDialog):
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-        container = QWidget()
-        grid = QGridLayout(container)
-        grid.setSpacing(10)
-        grid.setContentsMargins(4, 4, 4, 4)
-        self._cards: list[_AspectPreview] = []
-        cols = 4
-        for idx, ratio in enumerate(aspects):
-            card = _AspectPreview(ratio, self.theme, parent=container)
-            self._cards.append(card)
-            row = idx // cols
-            col = idx % cols
-            grid.addWidget(card, row, col)
-            card.clicked.connect(self.aspectCardClicked)
-            if ratio == (1, 1):
-                card.setSelected(True)
-        scroll.setWidget(container)
+        self._grid = _AspectGrid(aspects, self.theme)
+        self._grid.setSelectedRatio(self._selected_ratio)
+        self._grid.ratioSelected.connect(self.aspectCardClicked)
+        scroll.setWidget(self._grid)
         outer.addWidget(scroll, 1)
 
         # Buttons
@@ -277,11 +624,9 @@ class NewCanvasDialog(QDialog):
         self._applyStyles()
         self.resize(520, 420)
 
-    # Aspect card click handler (called from _AspectPreview)
-    def aspectCardClicked(self, card: _AspectPreview):
-        for c in self._cards:
-            c.setSelected(c is card)
-        self._selected_ratio = card.ratio
+    # Aspect card click handler (connected to _AspectGrid.ratioSelected)
+    def aspectCardClicked(self, ratio: tuple[int, int]):
+        self._selected_ratio = ratio
 
     def selectedName(self) -> str:
         return self.name_edit.text().strip() or "Untitled"
@@ -290,45 +635,12 @@ class NewCanvasDialog(QDialog):
         return self._selected_ratio
 
     def _applyStyles(self):
-        self.setStyleSheet(
-            f"""
-            QLabel{{ 
-                color: {self.theme.COLOR_TEXT_PRIMARY}; 
-                background: transparent;
-                border: none;
-            }}
-            QDialog#NewCanvasDialog {{
-                background: {self.theme.COLOR_SURFACE};
-                color: {self.theme.COLOR_TEXT_PRIMARY};
-                border: 1px solid {self.theme.COLOR_BORDER};
-            }}
-            QLabel#DialogTitle {{
-                color: {self.theme.COLOR_TEXT_PRIMARY};
-            }}
-            QLineEdit {{
-                background: {self.theme.COLOR_BACKGROUND};
-                border: 1px solid {self.theme.COLOR_BORDER};
-                padding: 4px 6px;
-                border-radius: 4px;
-                color: {self.theme.COLOR_TEXT_PRIMARY};
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {self.theme.COLOR_PRIMARY};
-            }}
-            QPushButton {{
-                background: {self.theme.COLOR_SURFACE_LIGHT};
-                border: 1px solid {self.theme.COLOR_BORDER};
-                padding: 6px 14px;
-                border-radius: 5px;
-                color: {self.theme.COLOR_TEXT_PRIMARY};
-            }}
-            QPushButton:hover {{ background: {self.theme.COLOR_BACKGROUND_ALT}; }}
-            QPushButton:pressed {{ background: {self.theme.COLOR_BACKGROUND}; }}
-        """
-        )
+        self.setStyleSheet(_dialog_qss(self.theme))
 
 
 class ImagePane(QWidget):
+    themeChanged = Signal(object)  # emits the newly applied theme
+
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
@@ -340,21 +652,34 @@ class ImagePane(QWidget):
         layout.addWidget(self.tabs, stretch=1)
 
         # Initial tab
-        self.addNewCanvasTab("Untitled 1")
+        self.addNewCanvasTab()
 
-        self.setStyleSheet(
-            f"background-color: {color_theme.COLOR_BACKGROUND_ALT};"
-            "color:black;"
-            f"border-right: 1px solid {color_theme.COLOR_BORDER};"
-        )
+        # Colour values the current stylesheet was built from (see applyTheme)
+        # Key and stylesheet both come from the live theme, which may have
+        # been edited in place since import.
+        self._theme_key = astuple(color_theme)
+        self.setStyleSheet(_image_pane_qss(color_theme))
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setMinimumHeight(0)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
+    # ---- Theming -----------------------------------------------------------
+    def applyTheme(self, theme):
+        """Restyle the pane for `theme`; a no-op if its colours are unchanged.
+
+        setStyleSheet re-polishes the whole child tree, so it is only called
+        when the theme's colour values actually differ from the current ones.
+        """
+        key = astuple(theme)
+        if key == self._theme_key:
+            return
+        self._theme_key = key
+        self.setStyleSheet(_image_pane_qss(theme))
+        self.tabs.applyTheme(theme)
+        self.themeChanged.emit(theme)
+
     # ---- Canvas / Aspect convenience wrappers ------------------------------
     def currentCanvas(self) -> ImageCanvas | None:
-        w = self.tabs.currentWidget()
-        return w if isinstance(w, ImageCanvas) else None
+        return self.tabs.currentCanvas()
 
     def setCanvasAspectRatio(self, w: int, h: int):
         canvas = self.currentCanvas()
@@ -369,17 +694,25 @@ class ImagePane(QWidget):
     # ---- Tab management -----------------------------------------------------
     def addNewCanvasTab(self, label: str | None = None, aspect=(1,1)):
         canvas = ImageCanvas(aspect_ratio=aspect)
+        self.themeChanged.connect(canvas._rebuildPaintCaches)
         idx = self.tabs.insertCanvasTab(canvas, label or self._nextDefaultLabel())
         self.tabs.setCurrentIndex(idx)
         return canvas
 
     def _nextDefaultLabel(self):
-        base = "Untitled"
-        existing = [self.tabs.tabText(i) for i in range(self.tabs.realTabCount())]
-        n=1
-        while f"{base} {n}" in existing:
-            n+=1
-        return f"{base} {n}"
+        # Lowest free "Untitled N": one pass collects the numeric suffixes in
+        # use, then candidates are tested against that set in O(1). Only the
+        # canonical spelling counts ("Untitled 01" doesn't take 1), and
+        # isdecimal() rather than isdigit() keeps int() from seeing "²".
+        used = set()
+        for i in range(self.tabs.realTabCount()):
+            base, _, num = self.tabs.tabText(i).rpartition(" ")
+            if base == "Untitled" and num.isdecimal() and str(int(num)) == num:
+                used.add(int(num))
+        n = 1
+        while n in used:
+            n += 1
+        return f"Untitled {n}"
 
     def renameCurrentTab(self, new_name: str):
         i = self.tabs.currentIndex()
@@ -404,28 +737,6 @@ class ImagePane(QWidget):
 
 
 # ---------------------- Custom Tab Bar (presentation-only) -------------------
-class _ImageCanvasTabBar(QTabBar):
-    """
-    Presentation-only tab bar. It NEVER mutates tabs itself.
-    All add/remove behavior is owned by _ImageCanvasTabWidget.
-    """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMovable(True)
-        self.setUsesScrollButtons(True)   # avoid squeezing close buttons off
-        self.setExpanding(False)
-
-    def mouseDoubleClickEvent(self, event):
-        idx = self.tabAt(event.pos())
-        if idx != -1:
-            old = self.tabText(idx)
-            new_text, ok = QInputDialog.getText(self, "Rename Tab", "Tab name:", text=old)
-            if ok and new_text.strip():
-                self.setTabText(idx, new_text.strip())
-        else:
-            super().mouseDoubleClickEvent(event)
-
-
 class _ImageCanvasTabBar(QTabBar):
     """
     Presentation-only tab bar. It NEVER mutates tabs itself.
@@ -440,12 +751,46 @@ class _ImageCanvasTabBar(QTabBar):
         self.setMovable(True)
         self.setUsesScrollButtons(True)
         self.setExpanding(False)
+        # Style-sheet size metrics are costly to query and only depend on the
+        # label, selection and close-button presence; cache them per key.
+        self._size_hint_cache: dict[tuple, QSize] = {}
+        # (pos, index) from the last press, reused by the double-click that
+        # follows it at the same spot; dropped whenever the tab layout changes.
+        self._press_hit = None
+
+    def tabSizeHint(self, index: int) -> QSize:
+        key = (
+            self.tabText(index),
+            index == self.currentIndex(),
+            self.tabButton(index, QTabBar.RightSide) is not None,
+        )
+        hint = self._size_hint_cache.get(key)
+        if hint is None:
+            hint = self._size_hint_cache[key] = super().tabSizeHint(index)
+        return hint
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange):
+            self._size_hint_cache.clear()
+        super().changeEvent(event)
+
+    def tabLayoutChange(self):
+        self._press_hit = None
+        super().tabLayoutChange()
+
+    def _tabAtCached(self, pos) -> int:
+        hit = self._press_hit
+        if hit is not None and hit[0] == pos:
+            return hit[1]
+        return self.tabAt(pos)
 
     def isPlusIndex(self, index: int) -> bool:
         return 0 <= index < self.count() and self.tabText(index) == "+"
 
     def mousePressEvent(self, event):
-        idx = self.tabAt(event.pos())
+        pos = event.pos()
+        idx = self.tabAt(pos)
+        self._press_hit = (pos, idx)
         if self.isPlusIndex(idx):
             # Consume the event and emit signal; do NOT let QTabBar change current tab.
             self.plusClicked.emit()
@@ -453,8 +798,9 @@ class _ImageCanvasTabBar(QTabBar):
         super().mousePressEvent(event)
 
     def mouseDoubleClickEvent(self, event):
-        idx = self.tabAt(event.pos())
+        idx = self._tabAtCached(event.pos())
         if idx != -1 and not self.isPlusIndex(idx):
+            from PySide6.QtWidgets import QInputDialog  # rename is a cold path
             old = self.tabText(idx)
             new_text, ok = QInputDialog.getText(self, "Rename Tab", "Tab name:", text=old)
             if ok and new_text.strip():
@@ -477,6 +823,14 @@ class _ImageCanvasTabWidget(QTabWidget):
     """
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Cached position of the '+' tab, kept current by tabInserted/tabRemoved
+        # and _onTabMoved so nothing has to call indexOf() on the tab list.
+        self._plus_index = -1
+        # Number of canvas tabs (every tab except '+'), maintained the same way
+        self._real_count = 0
+        # Canvas in the current tab (None while '+' is selected), refreshed
+        # from currentChanged so currentCanvas() is a plain attribute read.
+        self._current_canvas = None
 
         # --- Bar setup ---
         bar = _ImageCanvasTabBar()
@@ -484,55 +838,43 @@ class _ImageCanvasTabWidget(QTabWidget):
         self.setElideMode(Qt.ElideRight)  # elide long labels
         bar.plusClicked.connect(self._onPlusClicked)
 
-        # '+' must stay at the end even after drag reordering
-        self._adjusting_tab_order = False
-        if hasattr(self.tabBar(), "tabMoved"):
-            self.tabBar().tabMoved.connect(self._onTabMoved)
+        # '+' must stay at the end even after drag reordering; the fix-up is
+        # deferred so a burst of moves (dragging) is settled by one pin.
+        self._pin_pending = False
+        bar.tabMoved.connect(self._onTabMoved)
 
         # --- Widget-owned behaviors ---
         self.setDocumentMode(True)
         self.setMovable(True)
         self.setTabsClosable(True)
         self.tabCloseRequested.connect(self._onClose)
+        # currentChanged only tracks the current canvas: if Qt selects '+'
+        # (e.g. after closing the last canvas) it simply stays selected, and
+        # clicks on it still reach plusClicked without changing selection.
         self.currentChanged.connect(self._onCurrentChanged)
 
-        # --- Create persistent '+' page as last tab ---
+        # --- Create persistent '+' page as last tab (one instance for life) ---
         self._plus_page = QWidget()
         super().addTab(self._plus_page, "+")
         self._configurePlusTab()
 
         # --- Styling ---
-        self.setStyleSheet(
-            f"""
-            QTabWidget::pane {{ border: 0; }}
-            QTabBar::tab {{
-                background: {color_theme.COLOR_SURFACE};
-                color: {color_theme.COLOR_TEXT_SECONDARY};
-                padding: 5px 18px;           /* room for close button */
-                border: 1px solid {color_theme.COLOR_BORDER};
-                border-bottom: 2px solid {color_theme.COLOR_BACKGROUND_DEEP};
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                margin-right: 2px;
-                font-size: 12px;
-                min-width: 88px;             /* keep close button usable when crowded */
-            }}
-            QTabBar::tab:selected {{
-                background: {color_theme.COLOR_SURFACE_LIGHT};
-                color: {color_theme.COLOR_TEXT_PRIMARY};
-                border-bottom: 2px solid {color_theme.COLOR_PRIMARY};
-            }}
-            QTabBar::tab:!selected:hover {{ background: {color_theme.COLOR_SURFACE_LIGHT}; }}
-            """
-        )
+        self._qss = None
+        self.applyTheme(color_theme)
+
+    def applyTheme(self, theme) -> None:
+        """Restyle the tabs for `theme`, skipping setStyleSheet if unchanged."""
+        qss = _tab_widget_qss(theme)
+        # Memoized rendering returns the same object for the same colours
+        if qss is self._qss:
+            return
+        self._qss = qss
+        self.setStyleSheet(qss)
 
     # ---------- Helpers -------------------------------------------------------
-    def _plusIndex(self) -> int:
-        return self.indexOf(self._plus_page) if hasattr(self, "_plus_page") else -1
-
     def _configurePlusTab(self) -> None:
         """Make '+' non-closable and pinned at the end."""
-        pi = self._plusIndex()
+        pi = self._plus_index
         if pi == -1:
             return
         # Remove close buttons on '+' explicitly
@@ -540,27 +882,40 @@ class _ImageCanvasTabWidget(QTabWidget):
             self.tabBar().setTabButton(pi, side, None)
         self.setTabText(pi, "+")
         # Keep it last
+        self._pinPlusToEnd()
+
+    def _pinPlusToEnd(self) -> None:
+        """Move '+' back to the last position if something displaced it."""
+        self._pin_pending = False
+        pi = self._plus_index
         last = self.count() - 1
-        if pi != last:
-            self._adjusting_tab_order = True
-            self.tabBar().moveTab(pi, last)
-            self._adjusting_tab_order = False
+        if pi == -1 or pi == last:
+            return
+        bar = self.tabBar()
+        bar.setUpdatesEnabled(False)
+        try:
+            # Re-enters _onTabMoved, which just records '+' as last
+            bar.moveTab(pi, last)
+        finally:
+            bar.setUpdatesEnabled(True)
 
     def _ensurePlusTab(self) -> None:
-        """Ensure '+' page exists and is configured/pinned."""
-        if not hasattr(self, "_plus_page") or self._plusIndex() == -1:
-            self._plus_page = QWidget()
+        """Ensure the '+' page is in the tab list and is configured/pinned.
+
+        The page itself is created once in __init__ and reused, never
+        reallocated.
+        """
+        if self._plus_index == -1:
             super().addTab(self._plus_page, "+")
-        self._configurePlusTab()
+            self._configurePlusTab()
 
     def realTabCount(self) -> int:
         """Count only actual canvas widgets (ImageCanvas instances)."""
-        c = 0
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is not self._plus_page and isinstance(w, ImageCanvas):
-                c += 1
-        return c
+        return self._real_count
+
+    def currentCanvas(self) -> 'ImageCanvas | None':
+        """The ImageCanvas in the current tab, or None if '+' is selected."""
+        return self._current_canvas
 
     def insertCanvasTab(self, canvas: 'ImageCanvas', label: str) -> int:
         """
@@ -568,12 +923,32 @@ class _ImageCanvasTabWidget(QTabWidget):
         Parent (ImagePane) should call this after creating the canvas.
         """
         self._ensurePlusTab()
-        pi = self._plusIndex()
-        idx = self.insertTab(pi, canvas, label) if pi != -1 else self.addTab(canvas, label)
+        # Inserting at the '+' position keeps '+' last and leaves its (absent)
+        # close buttons untouched, so there is nothing to reconfigure.
+        idx = self.insertTab(self._plus_index, canvas, label)
         self.setCurrentIndex(idx)
-        self._configurePlusTab()
         return idx
 
+    # ---------- Index bookkeeping -------------------------------------------
+    def tabInserted(self, index: int) -> None:
+        if self.widget(index) is self._plus_page:
+            self._plus_index = index
+        else:
+            self._real_count += 1
+            if index <= self._plus_index:
+                self._plus_index += 1
+        super().tabInserted(index)
+
+    def tabRemoved(self, index: int) -> None:
+        # The widget is already gone here; anything that isn't '+' is a canvas
+        if index == self._plus_index:
+            self._plus_index = -1
+        else:
+            self._real_count -= 1
+            if index < self._plus_index:
+                self._plus_index -= 1
+        super().tabRemoved(index)
+
     # ---------- Events --------------------------------------------------------
     def _onPlusClicked(self) -> None:
         """Bar told us '+' was clicked; show dialog for new canvas parameters."""
@@ -583,26 +958,23 @@ class _ImageCanvasTabWidget(QTabWidget):
         # After possible add, '+' remains last; selection stays on previous tab.
 
     def _onCurrentChanged(self, index: int) -> None:
-        """
-        If Qt ever tries to select '+' (e.g., after closing the last canvas),
-        we just ignore it and leave it selected; clicks on '+' still work because
-        the bar emits plusClicked without changing selection.
-        No auto-spawn here: user must click '+' to add a new tab.
-        """
-        # Nothing required; leaving '+' selected is okay since click still triggers via bar.
+        w = self.widget(index)
+        self._current_canvas = w if isinstance(w, ImageCanvas) else None
 
     def _onTabMoved(self, from_index: int, to_index: int) -> None:
         """Keep '+' pinned to the end after any move."""
-        if self._adjusting_tab_order:
-            return
-        pi = self._plusIndex()
-        if pi == -1:
+        pi = self._plus_index
+        if from_index == pi:
+            pi = to_index
+        elif from_index < pi <= to_index:
+            pi -= 1
+        elif to_index <= pi < from_index:
+            pi += 1
+        self._plus_index = pi
+        if pi == -1 or pi == self.count() - 1 or self._pin_pending:
             return
-        last = self.count() - 1
-        if pi != last:
-            self._adjusting_tab_order = True
-            self.tabBar().moveTab(pi, last)
-            self._adjusting_tab_order = False
+        self._pin_pending = True
+        QTimer.singleShot(0, self._pinPlusToEnd)
 
     def _onClose(self, index: int) -> None:
         """
@@ -615,32 +987,35 @@ class _ImageCanvasTabWidget(QTabWidget):
         if not isinstance(w, ImageCanvas):
             return
 
-        # Block signals during removal to avoid currentChanged races
-        tb = self.tabBar()
-        was_blocked_self = self.signalsBlocked()
-        was_blocked_tb = tb.signalsBlocked() if tb is not None else False
+        # Batch removal + reselection so the tab widget repaints only once
+        self.setUpdatesEnabled(False)
         try:
+            # Block signals during removal to avoid currentChanged races.
+            # Only tabCloseRequested gets here, never with signals already
+            # blocked, so there is no previous state to save and restore.
+            tb = self.tabBar()
             self.blockSignals(True)
-            if tb is not None:
-                tb.blockSignals(True)
-            self.removeTab(index)
-        finally:
-            if tb is not None:
-                tb.blockSignals(was_blocked_tb)
-            self.blockSignals(was_blocked_self)
+            tb.blockSignals(True)
+            try:
+                self.removeTab(index)
+            finally:
+                tb.blockSignals(False)
+                self.blockSignals(False)
 
-        # Optional: tidy up the widget
-        try:
             w.deleteLater()
-        except Exception:
-            pass
 
-        self._ensurePlusTab()
+            self._ensurePlusTab()
+
+            # If some tabs remain, select a sensible neighbor; otherwise, leave only '+'
+            if self.realTabCount() > 0:
+                target = min(index, self.count() - 1)
+                if self.widget(target) is self._plus_page and target - 1 >= 0:
+                    target -= 1
+                self.setCurrentIndex(target)
+            # else: zero real tabs -> only '+' present; clicking '+' adds a new one.
 
-        # If some tabs remain, select a sensible neighbor; otherwise, leave only '+'
-        if self.realTabCount() > 0:
-            target = min(index, self.count() - 1)
-            if self.widget(target) is self._plus_page and target - 1 >= 0:
-                target -= 1
-            self.setCurrentIndex(target)
-        # else: zero real tabs -> only '+' present; clicking '+' adds a new one.
\ No newline at end of file
+            # currentChanged was blocked during removal (and setCurrentIndex
+            # may not emit), so refresh the cached canvas explicitly.
+            self._onCurrentChanged(self.currentIndex())
+        finally:
+            self.setUpdatesEnabled(True)
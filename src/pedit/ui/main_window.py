@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 
 from PySide6.QtCore import QSize, Qt, qVersion
 from PySide6.QtWidgets import (
@@ -17,7 +18,53 @@ try:
 except Exception:  # pragma: no cover - fallback
     __version__ = "unknown"
     __project__ = "imdge_editor"
-from .menu_bar import MainMenu, MENU_SPEC, MENU_STYLESHEET
+from .menu_bar import MainMenu, MENU_SPEC, get_menu_stylesheet
+
+
+@lru_cache(maxsize=1)
+def _about_html() -> str:
+    """Render the About dialog body; the metadata is fixed for the process."""
+    # Collect extended metadata if available
+    homepage = None
+    try:  # Attempt to get Home-page from distribution metadata
+        from importlib.metadata import metadata
+        meta = metadata(__project__)
+        homepage = meta.get("Home-page") or meta.get("Project-URL")
+    except Exception:
+        pass
+
+    qt_version = None
+    try:
+        qt_version = qVersion()
+    except Exception:
+        qt_version = "unknown"
+
+    info_rows = [
+        ("Product", __project__),
+        ("Version", __version__),
+        ("PySide6", PySide6.__version__),
+        ("Qt", qt_version),
+        ("Python", platform.python_version()),
+        ("Platform", platform.platform()),
+    ]
+
+    # Build HTML table for nice alignment
+    rows_html = "".join(
+        f"<tr><td style='padding:2px 8px;font-weight:600;' align='right'>{label}:</td>"
+        f"<td style='padding:2px 4px;'>{value}</td></tr>" for label, value in info_rows
+    )
+    links_html = f"<p><a href='{homepage}' style='color:#6aa9ff;text-decoration:none;'>{homepage}</a></p>" if homepage else ""
+
+    html = f"""
+    <div style='font-family:Segoe UI,Arial,sans-serif;font-size:12px;'>
+      <h3 style='margin:0 0 6px 0;'>{__project__}</h3>
+      <table style='border-collapse:collapse;'>{rows_html}</table>
+      {links_html}
+      <p style='margin-top:4px;'>Press Ctrl+Q to exit the application.</p>
+    </div>
+    """
+    return html
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -41,56 +88,16 @@ class MainWindow(QMainWindow):
         main_layout.setStretchFactor(side_pane, 0)
         main_layout.setStretchFactor(image_pane, 1)
 
-        MainMenu.create_menu(self, MENU_SPEC, stylesheet=MENU_STYLESHEET)
+        MainMenu.create_menu(self, MENU_SPEC, stylesheet=get_menu_stylesheet())
         self.setCentralWidget(container)
 
     # ---- Menu action slots -------------------------------------------------
     def on_about(self):
         """Show an About dialog with version & environment info (like VS Code)."""
-        # Collect extended metadata if available
-        homepage = None
-        try:  # Attempt to get Home-page from distribution metadata
-            from importlib.metadata import metadata
-            meta = metadata(__project__)
-            homepage = meta.get("Home-page") or meta.get("Project-URL")
-        except Exception:
-            pass
-
-        qt_version = None
-        try:
-            qt_version = qVersion()
-        except Exception:
-            qt_version = "unknown"
-
-        info_rows = [
-            ("Product", __project__),
-            ("Version", __version__),
-            ("PySide6", PySide6.__version__),
-            ("Qt", qt_version),
-            ("Python", platform.python_version()),
-            ("Platform", platform.platform()),
-        ]
-
-        # Build HTML table for nice alignment
-        rows_html = "".join(
-            f"<tr><td style='padding:2px 8px;font-weight:600;' align='right'>{label}:</td>"
-            f"<td style='padding:2px 4px;'>{value}</td></tr>" for label, value in info_rows
-        )
-        links_html = f"<p><a href='{homepage}' style='color:#6aa9ff;text-decoration:none;'>{homepage}</a></p>" if homepage else ""
-
-        html = f"""
-        <div style='font-family:Segoe UI,Arial,sans-serif;font-size:12px;'>
-          <h3 style='margin:0 0 6px 0;'>{__project__}</h3>
-          <table style='border-collapse:collapse;'>{rows_html}</table>
-          {links_html}
-          <p style='margin-top:4px;'>Press Ctrl+Q to exit the application.</p>
-        </div>
-        """
-
         # Use QMessageBox for simplicity (could be upgraded to custom QDialog later)
         box = QMessageBox(self)
         box.setWindowTitle(f"About {__project__}")
         box.setTextFormat(Qt.RichText)
-        box.setText(html)
+        box.setText(_about_html())
         box.setStandardButtons(QMessageBox.Ok)
         box.exec()
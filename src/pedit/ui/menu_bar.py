@@ -1,8 +1,134 @@
-from PySide6.QtWidgets import QMenu
+import sys
+from dataclasses import dataclass
+from functools import lru_cache, partial
+
 from PySide6.QtGui import QIcon, QKeySequence, QAction
-from PySide6 import QtWidgets
 from pedit.core.theme import color_theme
 
+
+def _spec_key(node):
+    """Hashable digest of a menu spec; callables are keyed by identity."""
+    if isinstance(node, dict):
+        return tuple(sorted((k, _spec_key(v)) for k, v in node.items()))
+    if isinstance(node, (list, tuple)):
+        return tuple(_spec_key(v) for v in node)
+    if callable(node):
+        return ("callable", id(node))
+    return node
+
+
+def _freeze(node):
+    """Recursively turn a menu spec into nested tuples of sorted (key, value)
+    pairs, making it hashable (and immutable) as-is."""
+    if isinstance(node, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in node.items()))
+    if isinstance(node, list):
+        return tuple(_freeze(v) for v in node)
+    return node
+
+
+def _as_dict(entry) -> dict:
+    """A spec entry as a dict, whether it was given as a dict or frozen."""
+    return entry if isinstance(entry, dict) else dict(entry)
+
+
+class MenuRegistry(dict):
+    """Built menus and actions keyed by path tuples like ("File", "Open").
+
+    Lookups and updates also accept the "File/Open" string form, which is
+    split on the fly; the joined strings are never built for internal use.
+    Iteration, keys() and items() always yield the tuple form.
+    """
+
+    @staticmethod
+    def _key(path):
+        return tuple(path.split("/")) if isinstance(path, str) else path
+
+    def by_path(self, path: str):
+        return dict.__getitem__(self, tuple(path.split("/")))
+
+    def __getitem__(self, path):
+        return dict.__getitem__(self, self._key(path))
+
+    def __contains__(self, path):
+        return dict.__contains__(self, self._key(path))
+
+    def get(self, path, default=None):
+        return dict.get(self, self._key(path), default)
+
+    def __setitem__(self, path, value):
+        dict.__setitem__(self, self._key(path), value)
+
+    def __delitem__(self, path):
+        dict.__delitem__(self, self._key(path))
+
+    def pop(self, path, *default):
+        return dict.pop(self, self._key(path), *default)
+
+    def setdefault(self, path, default=None):
+        return dict.setdefault(self, self._key(path), default)
+
+
+# The same shortcut/icon strings recur across actions and rebuilds
+@lru_cache(maxsize=None)
+def _key_sequence(text: str) -> QKeySequence:
+    # Specs are written in portable "Ctrl+O" form; say so instead of letting
+    # the constructor guess, and parse each distinct string only once.
+    return QKeySequence.fromString(text, QKeySequence.PortableText)
+
+
+@lru_cache(maxsize=None)
+def _icon(path: str) -> QIcon:
+    return QIcon(path)
+
+
+def _set_shortcut(action: QAction, value) -> None:
+    action.setShortcut(_key_sequence(value))
+    action.setShortcutVisibleInContextMenu(True)
+
+
+def _if_set(setter):
+    """Wrap `setter` so empty values (None, "") are skipped."""
+    return lambda action, value: setter(action, value) if value else None
+
+
+# Spec key -> setter, so applying props walks the item's own keys once.
+# "checked" is not listed: it must run after "checkable" whatever the order.
+_SETTERS = {
+    "shortcut": _if_set(_set_shortcut),
+    "checkable": lambda a, v: a.setCheckable(bool(v)),
+    "enabled": lambda a, v: a.setEnabled(bool(v)),
+    "visible": lambda a, v: a.setVisible(bool(v)),
+    "statusTip": _if_set(lambda a, v: a.setProperty("_pedit_statusTip", v)),
+    "whatsThis": _if_set(lambda a, v: a.setProperty("_pedit_whatsThis", v)),
+    "icon": _if_set(lambda a, v: a.setIcon(_icon(v))),
+    "objectName": _if_set(QAction.setObjectName),
+    "data": QAction.setData,
+}
+
+
+# Tips are stored as dynamic properties at build time and only applied the
+# first time their action is hovered (see _lazy_tips).
+_LAZY_TIPS = (
+    ("_pedit_statusTip", QAction.setStatusTip),
+    ("_pedit_whatsThis", QAction.setWhatsThis),
+)
+
+
+def _lazy_tips(menu, action: QAction) -> None:
+    """QMenu.hovered slot: apply an action's deferred tips on first hover."""
+    shown = False
+    for prop, setter in _LAZY_TIPS:
+        value = action.property(prop)
+        if value is not None:
+            setter(action, value)
+            action.setProperty(prop, None)
+            shown = True
+    if shown:
+        # Qt may already have posted this hover's (empty) status text
+        action.showStatusText(menu)
+
+
 class MainMenu:
     """
     Build a QMenuBar from a declarative spec.
@@ -45,10 +171,79 @@ class MainMenu:
     def create_menu(main_window, menu_spec, stylesheet: str = None):
         """
         Creates the menu bar on main_window using menu_spec.
-        Returns (menu_bar, registry) where registry maps 'Menu/Item' to QAction/QMenu.
+        Returns (menu_bar, registry) where registry is a MenuRegistry mapping
+        ("Menu", "Item") (or "Menu/Item") to QAction/QMenu.
+        Entries below a submenu appear in the registry once that submenu has
+        been shown for the first time, and so do their shortcuts.
+
+        The result is cached on main_window: calling again with an equal spec
+        and stylesheet returns the existing menus instead of rebuilding them.
+        stylesheet=None uses the (cached) stylesheet for the current theme;
+        pass "" to leave the menu bar unstyled.
         """
         menu_bar = main_window.menuBar()
-        registry = {}  # e.g. {"File": QMenu, "File/Open": QAction, ...}
+        if stylesheet is None:
+            stylesheet = get_menu_stylesheet()
+        # A frozen spec (see _freeze) is already hashable: skip the digest walk
+        spec_key = menu_spec if isinstance(menu_spec, tuple) else _spec_key(menu_spec)
+        key = (spec_key, stylesheet)
+        # Kept on the window itself so it dies with it; a module-level
+        # id(main_window) map could hand a new window a dead window's menus.
+        cached = getattr(main_window, "_pedit_menu_cache", None)
+        if cached is not None:
+            if cached[0] == key:
+                return cached[1]
+            # Different spec: detach everything and drop the old menus. The
+            # actions belong to the window and are reused below.
+            menu_bar.clear()
+            for obj in cached[1][1].values():
+                if not isinstance(obj, QAction):
+                    obj.deleteLater()
+
+        registry = MenuRegistry()  # e.g. {("File",): QMenu, ("File", "Open"): QAction, ...}
+        # (path, occurrence) -> (item digest, QAction), kept across rebuilds.
+        # Actions are parented to main_window, so they outlive the menus
+        # showing them and an unchanged item reuses its action (props and
+        # connections intact). The occurrence index gives repeated items
+        # with the same path their own action; a QAction is in a menu once.
+        actions = getattr(main_window, "_pedit_menu_actions", None)
+        if actions is None:
+            actions = main_window._pedit_menu_actions = {}
+
+        # Resolve every string "triggered" target once up front, submenus
+        # included, so building an action is just a dict lookup. The lazy
+        # submenu builds share the same map. The same walk collects the
+        # action paths of this spec, to retire actions of removed items.
+        names = set()
+        live = set()
+        seen = {}  # path -> occurrences so far, for the (path, n) pool keys
+        tops = [_as_dict(top) for top in menu_spec]
+        pending = [((top.get("title", "Menu"),), top.get("items") or ()) for top in tops]
+        while pending:
+            parts, items = pending.pop()
+            for it in items:
+                it = _as_dict(it)
+                if it.get("separator"):
+                    continue
+                if "submenu" in it:
+                    pending.append((parts + (it.get("text", "Submenu"),), it.get("submenu") or ()))
+                    continue
+                path = parts + (it.get("text", "Unnamed"),)
+                n = seen.get(path, 0)
+                seen[path] = n + 1
+                live.add((path, n))
+                target = it.get("triggered")
+                if isinstance(target, str):
+                    names.add(target)
+        for pool_key in [k for k in actions if k not in live]:
+            actions.pop(pool_key)[1].deleteLater()
+        # Reset for the build; the lazy submenu builds keep counting from it
+        seen.clear()
+        slot_map = {}
+        for name in names:
+            slot = getattr(main_window, name, None)
+            if callable(slot):
+                slot_map[name] = slot
 
         def _connect_trigger(action: QAction, target):
             """
@@ -61,94 +256,117 @@ class MainMenu:
             if callable(target):
                 action.triggered.connect(target)
             elif isinstance(target, str):
-                slot = getattr(main_window, target, None)
-                if callable(slot):
+                slot = slot_map.get(target)
+                if slot is not None:
                     action.triggered.connect(slot)
                 else:
                     # No-op if method not found; you can raise if you prefer
                     pass
 
         def _apply_action_props(action: QAction, spec: dict):
-            if spec.get("shortcut"):
-                action.setShortcut(QKeySequence(spec["shortcut"]))
-                action.setShortcutVisibleInContextMenu(True)
-            if "checkable" in spec:
-                action.setCheckable(bool(spec["checkable"]))
+            get = _SETTERS.get
+            for k, v in spec.items():
+                setter = get(k)
+                if setter is not None:
+                    setter(action, v)
             if "checked" in spec:
                 action.setChecked(bool(spec["checked"]))
-            if "enabled" in spec:
-                action.setEnabled(bool(spec["enabled"]))
-            if "visible" in spec:
-                action.setVisible(bool(spec["visible"]))
-            if spec.get("statusTip"):
-                action.setStatusTip(spec["statusTip"])
-            if spec.get("whatsThis"):
-                action.setWhatsThis(spec["whatsThis"])
-            if spec.get("icon"):
-                action.setIcon(QIcon(spec["icon"]))
-            if spec.get("objectName"):
-                action.setObjectName(spec["objectName"])
-            if "data" in spec:
-                action.setData(spec["data"])
             _connect_trigger(action, spec.get("triggered"))
 
-        def _build_menu(parent_menu, title: str, items: list, prefix_path: str):
-            menu = parent_menu.addMenu(title) if isinstance(parent_menu, QtWidgets.QMenuBar) else QMenu(title, parent_menu)
-            full_path = title if not prefix_path else f"{prefix_path}/{title}"
-            registry[full_path] = menu
-
-            for it in items or []:
-                if it.get("separator"):
-                    menu.addSeparator()
-                    continue
+        def _build(frames):
+            """Build (parent_menu, item_spec, parent_parts) frames in order.
 
-                if "submenu" in it:
-                    sub_title = it.get("text", "Submenu")
-                    sub_items = it.get("submenu", [])
-                    sub_menu = menu.addMenu(sub_title)
-                    registry[f"{full_path}/{sub_title}"] = sub_menu
-                    # Recurse into submenu items
-                    for sub_it in sub_items:
-                        if sub_it.get("separator"):
-                            sub_menu.addSeparator()
-                            continue
-                        if "submenu" in sub_it:
-                            # Nested submenu
-                            nested_title = sub_it.get("text", "Submenu")
-                            nested_items = sub_it.get("submenu", [])
-                            _build_menu(sub_menu, nested_title, nested_items, full_path)
-                            continue
-                        # Regular action in submenu
-                        act = QAction(sub_it.get("text", "Unnamed"), menu)
-                        _apply_action_props(act, sub_it)
-                        sub_menu.addAction(act)
-                        registry[f"{full_path}/{sub_title}/{act.text()}"] = act
+            Runs in passes: resolve every leaf action's path first, then
+            allocate all the new QActions in one tight loop, then assemble the
+            menus in spec order. Submenus only get an empty shell here; their
+            items are built the first time the submenu is about to be shown.
+            """
+            # Pass 1: normalise the frames and find the leaves needing a QAction
+            frames = [(menu, _as_dict(it), parts) for menu, it, parts in frames]
+            keys = []    # per frame: the action's (path, occurrence) key, or None
+            leaves = []  # (key, item digest, item) of actions to create
+            for menu, it, parts in frames:
+                if it.get("separator") or "submenu" in it:
+                    keys.append(None)
                     continue
+                path = parts + (sys.intern(it.get("text", "Unnamed")),)
+                n = seen.get(path, 0)
+                seen[path] = n + 1
+                pool_key = (path, n)
+                keys.append(pool_key)
+                item_key = _spec_key(it)
+                entry = actions.get(pool_key)
+                if entry is None or entry[0] != item_key:
+                    if entry is not None:
+                        entry[1].deleteLater()
+                    leaves.append((pool_key, item_key, it))
 
-                # Regular action
-                text = it.get("text", "Unnamed")
-                act = QAction(text, menu)
+            # Pass 2: allocate and configure the new actions
+            for pool_key, item_key, it in leaves:
+                act = QAction(pool_key[0][-1], main_window)
                 _apply_action_props(act, it)
-                menu.addAction(act)
-                registry[f"{full_path}/{text}"] = act
+                actions[pool_key] = (item_key, act)
 
-            return menu
+            # Pass 3: wire everything into its menu. Consecutive actions for
+            # one menu go in a single addActions() call; a separator, submenu
+            # or different menu ends the run.
+            run_menu, run = None, []
+            for (menu, it, parts), pool_key in zip(frames, keys):
+                if run and (pool_key is None or menu is not run_menu):
+                    run_menu.addActions(run)
+                    run = []
+                if pool_key is not None:
+                    act = actions[pool_key][1]
+                    run_menu = menu
+                    run.append(act)
+                    # As before, a repeated path registers its last action
+                    registry[pool_key[0]] = act
+                elif it.get("separator"):
+                    menu.addSeparator()
+                else:
+                    sub_items = it.get("submenu")
+                    if not sub_items:
+                        continue  # an empty submenu gets no QMenu at all
+                    text = it.get("text", "Submenu")
+                    sub_parts = parts + (sys.intern(text),)
+                    sub_menu = menu.addMenu(text)
+                    sub_menu.hovered.connect(partial(_lazy_tips, sub_menu))
+                    registry[sub_parts] = sub_menu
+                    sub_menu.aboutToShow.connect(_lazy_build(sub_menu, sub_items, sub_parts))
+            if run:
+                run_menu.addActions(run)
 
-        # Build top-level menus
-        for top in menu_spec:
+        def _lazy_build(sub_menu, items, parts):
+            """One-shot aboutToShow slot that fills sub_menu on first display."""
+            def build():
+                sub_menu.aboutToShow.disconnect(build)
+                _build((sub_menu, it, parts) for it in items)
+            return build
+
+        # Top-level menus are built eagerly so their shortcuts work at once
+        frames = []
+        for top in tops:
+            items = top.get("items")
+            if not items:
+                continue  # nothing to show: don't allocate an empty QMenu
             title = top.get("title", "Menu")
-            items = top.get("items", [])
-            _build_menu(menu_bar, title, items, prefix_path="")
+            menu = menu_bar.addMenu(title)
+            menu.hovered.connect(partial(_lazy_tips, menu))
+            parts = (sys.intern(title),)
+            registry[parts] = menu
+            frames.extend((menu, it, parts) for it in items)
+        _build(frames)
 
         # Apply stylesheet if provided (or keep yours)
         if stylesheet:
             menu_bar.setStyleSheet(stylesheet)
 
+        main_window._pedit_menu_cache = (key, (menu_bar, registry))
         return menu_bar, registry
 
 # In your main window code:
 
-MENU_SPEC = [
+MENU_SPEC = _freeze([
     {
         "title": "File",
         "items": [
@@ -178,44 +396,86 @@ MENU_SPEC = [
             },
         ],
     },
-]
-
-MENU_STYLESHEET = f"""
-        QMenuBar {{
-            spacing: 1px;
-            padding: 1px 1px;
-            background-color: {color_theme.COLOR_BACKGROUND};
-            color: {color_theme.COLOR_TEXT_PRIMARY};
-            border-bottom: 1px solid {color_theme.COLOR_BORDER};
-        }}
-        QMenuBar::item {{
-            spacing: 5px;
-            padding: 4px 10px;
-            background: transparent;
-            color: {color_theme.COLOR_TEXT_PRIMARY};
-        }}
-        QMenuBar::item:selected {{ 
-            background: {color_theme.COLOR_SURFACE_LIGHT}; 
-            color: {color_theme.COLOR_TEXT_PRIMARY}; 
-        }}
-        QMenuBar::item:pressed  {{ 
-            background: {color_theme.COLOR_PRIMARY}; 
-            color: {color_theme.COLOR_TEXT_PRIMARY}; 
-        }}
-
-        QMenu {{
-            background-color: {color_theme.COLOR_SURFACE};
-            border: 1px solid {color_theme.COLOR_BORDER};
-            color: {color_theme.COLOR_TEXT_PRIMARY};
-        }}
-        QMenu::item {{
-            padding: 4px 20px;
-            background: transparent;
-            color: {color_theme.COLOR_TEXT_PRIMARY};
-        }}
-        QMenu::item:selected {{ 
-            background: {color_theme.COLOR_PRIMARY}; 
-            color: {color_theme.COLOR_TEXT_PRIMARY}; 
-        }}
-        /* Note: QSS can't separately style shortcut vs label */
+])
+
+
+@dataclass(frozen=True, slots=True)
+class _ThemeSnap:
+    """The theme colours the menu stylesheet uses, as a small hashable key."""
+    bg: str
+    text: str
+    border: str
+    surface: str
+    surface_light: str
+    primary: str
+
+    @classmethod
+    def from_theme(cls, theme) -> "_ThemeSnap":
+        return cls(
+            theme.COLOR_BACKGROUND, theme.COLOR_TEXT_PRIMARY, theme.COLOR_BORDER,
+            theme.COLOR_SURFACE, theme.COLOR_SURFACE_LIGHT, theme.COLOR_PRIMARY,
+        )
+
+
+@lru_cache(maxsize=8)
+def _menu_qss(snap: _ThemeSnap) -> str:
+    """Format the menu bar/menu stylesheet; memoized per theme snapshot."""
+    bg, text, border = snap.bg, snap.text, snap.border
+    surface, surface_light, primary = snap.surface, snap.surface_light, snap.primary
+    return f"""
+            QMenuBar {{
+                spacing: 1px;
+                padding: 1px 1px;
+                background-color: {bg};
+                color: {text};
+                border-bottom: 1px solid {border};
+            }}
+            QMenuBar::item {{
+                spacing: 5px;
+                padding: 4px 10px;
+                background: transparent;
+                color: {text};
+            }}
+            QMenuBar::item:selected {{ 
+                background: {surface_light}; 
+                color: {text}; 
+            }}
+            QMenuBar::item:pressed  {{ 
+                background: {primary}; 
+                color: {text}; 
+            }}
+
+            QMenu {{
+                background-color: {surface};
+                border: 1px solid {border};
+                color: {text};
+            }}
+            QMenu::item {{
+                padding: 4px 20px;
+                background: transparent;
+                color: {text};
+            }}
+            QMenu::item:selected {{ 
+                background: {primary}; 
+                color: {text}; 
+            }}
+            /* Note: QSS can't separately style shortcut vs label */
+        """
+
+
+def get_menu_stylesheet() -> str:
+    """Menu stylesheet for the current color_theme (rendered once per theme)."""
+    return _menu_qss(_ThemeSnap.from_theme(color_theme))
+
+
+def apply_global_menu_style(app=None) -> None:
+    """Set the menu stylesheet once on the QApplication instead of per menu bar.
+
+    Pair with create_menu(..., stylesheet="") so the bar doesn't also get
+    its own copy.
     """
+    from PySide6.QtWidgets import QApplication
+
+    app = app or QApplication.instance()
+    if app is not None:
+        app.setStyleSheet(get_menu_stylesheet())
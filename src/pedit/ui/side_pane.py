@@ -1,7 +1,7 @@
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel,
+    QWidget, QLabel,
     QSizePolicy
 )
 
@@ -10,12 +10,9 @@ from pedit.core.theme import color_theme
 class SidePane(QWidget):
     def __init__(self):
         super().__init__()
-        layout = QVBoxLayout()
-        label = QLabel("HELLO this is side pane")
-        layout.setContentsMargins(0,0,0,0)
-        layout.addWidget(label, alignment=Qt.AlignTop)
-        layout.addStretch(1)
-        self.setLayout(layout) 
+        # A single top-aligned label in a fixed-width pane: place it directly
+        # in resizeEvent instead of running a layout on every resize.
+        self._label = QLabel("HELLO this is side pane", self)
 
         self.setStyleSheet(
             f"background-color: {color_theme.COLOR_BACKGROUND};"
@@ -29,3 +26,6 @@ class SidePane(QWidget):
         self.setFixedWidth(300)
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._label.setGeometry(0, 0, self.width(), self._label.sizeHint().height())